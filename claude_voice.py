@@ -16,6 +16,8 @@ import sys
 import os
 import subprocess
 import select
+import selectors
+import errno
 import tty
 import termios
 import signal
@@ -27,44 +29,98 @@ import socket
 import struct
 import fcntl
 import shlex
+import shutil
+import tomllib
+import threading
+import wave
+import io
 from pathlib import Path
-from configparser import ConfigParser
 from typing import Optional
 
 try:
+    import httpx
     from openai import OpenAI
 except ImportError:
-    print("ERROR: openai package not installed. Run: pip install openai")
-    sys.exit(1)
+    OpenAI = None  # Only required for the OpenAI Whisper backend
+
+try:
+    import pyinotify
+except ImportError:
+    pyinotify = None  # Optional: fall back to polling the file size
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None  # Optional: stream audio without silence trimming
+
+try:
+    import soundfile
+except ImportError:
+    soundfile = None  # Optional: upload streamed audio as WAV instead of Opus
 
 # MCP server is now a separate script (tts_mcp_server.py)
 
+# Capture format: 16 kHz mono, what Whisper expects (streamed as signed 16-bit PCM)
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+PARTIAL_INTERVAL_SAMPLES = SAMPLE_RATE * 2  # Run a partial transcription every ~2s of new audio
+MIN_TAIL_SAMPLES = SAMPLE_RATE // 4  # Skip final pass when less than 250ms is left
+VAD_FRAME_BYTES = SAMPLE_RATE * 30 // 1000 * SAMPLE_WIDTH  # webrtcvad works on 30ms frames
+VAD_PADDING_FRAMES = 5  # Keep 150ms around detected speech so word edges aren't clipped
 
-class Config:
-    """Load and validate configuration from INI file"""
+# Resolved once so spawning the recorder skips the PATH search
+RECORDER_BIN = shutil.which('termux-microphone-record') or 'termux-microphone-record'
+
+RECORDING_SETTLE_TIMEOUT = 0.5  # Max seconds to wait for the recorder to finish the file
+MIN_RECORDING_BYTES = 1000
+
+PTY_CHUNK = 65536  # Max bytes moved from the PTY to stdout per wakeup
 
-    def __init__(self, config_path: str = "voice_config.ini"):
-        self.config = ConfigParser()
+# Parsed configs keyed on (path, mtime, size); unchanged files are never reparsed
+_CONFIG_CACHE: dict[tuple, dict] = {}
 
+
+class Config:
+    """Load and validate configuration from TOML file"""
+
+    def __init__(self, config_path: str = "voice_config.toml"):
         if not os.path.exists(config_path):
             print(f"ERROR: Config file not found: {config_path}")
-            print(f"Copy voice_config.ini.example to {config_path} and edit with your settings")
+            print(f"Copy voice_config.toml.example to {config_path} and edit with your settings")
             sys.exit(1)
 
-        self.config.read(config_path)
+        st = os.stat(config_path)
+        key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        if key in _CONFIG_CACHE:
+            self.config = _CONFIG_CACHE[key]
+            return
+
+        try:
+            with open(config_path, 'rb') as f:
+                self.config = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            print(f"ERROR: Invalid config file {config_path}: {e}")
+            sys.exit(1)
         self._validate()
+        _CONFIG_CACHE[key] = self.config
 
     def _validate(self):
         """Validate required config sections and keys"""
         required = {
             'ssh': ['host', 'user', 'key_path'],  # dev_path is optional (can use CLI arg)
             'claude': ['path'],
-            'openai': ['api_key'],
             'tts': ['pitch', 'rate']
         }
 
+        backend = self.get('whisper', 'backend', fallback='openai')
+        if backend not in ('openai', 'faster-whisper'):
+            print(f"ERROR: Unknown whisper backend: {backend} (use openai or faster-whisper)")
+            sys.exit(1)
+        if backend == 'openai':
+            required['openai'] = ['api_key']
+
         for section, keys in required.items():
-            if section not in self.config:
+            if not isinstance(self.config.get(section), dict):
                 print(f"ERROR: Missing [{section}] section in config")
                 sys.exit(1)
             for key in keys:
@@ -74,15 +130,190 @@ class Config:
 
     def get(self, section: str, key: str, fallback=None):
         """Get config value with optional fallback"""
-        return self.config.get(section, key, fallback=fallback)
+        return self.config.get(section, {}).get(key, fallback)
 
     def getint(self, section: str, key: str, fallback=None):
         """Get config integer value"""
-        return self.config.getint(section, key, fallback=fallback)
+        value = self.get(section, key, fallback)
+        return int(value) if value is not None else None
 
     def getfloat(self, section: str, key: str, fallback=None):
         """Get config float value"""
-        return self.config.getfloat(section, key, fallback=fallback)
+        value = self.get(section, key, fallback)
+        return float(value) if value is not None else None
+
+
+def pcm_to_wav(pcm: bytes) -> bytes:
+    """Wrap raw 16 kHz mono PCM in a WAV container for upload"""
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(SAMPLE_WIDTH)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+def encode_pcm_for_upload(pcm: bytes) -> tuple:
+    """Encode raw PCM for the Whisper API, returning (filename, data)
+
+    Uses Ogg/Opus when soundfile's libsndfile supports it, which is several
+    times smaller than WAV on slow mobile uplinks.
+    """
+    if soundfile is not None and 'OPUS' in soundfile.available_subtypes('OGG'):
+        import numpy as np
+        buf = io.BytesIO()
+        samples = np.frombuffer(pcm[:len(pcm) - len(pcm) % SAMPLE_WIDTH], np.int16)
+        soundfile.write(buf, samples, SAMPLE_RATE, format='OGG', subtype='OPUS')
+        return "audio.ogg", buf.getvalue()
+    return "audio.wav", pcm_to_wav(pcm)
+
+
+class StreamingTranscriber:
+    """Transcribe PCM audio incrementally while it is being recorded
+
+    A reader thread accumulates audio from the capture process. Every
+    PARTIAL_INTERVAL_SAMPLES of new audio a worker thread transcribes the
+    uncommitted buffer; all segments but the last (which may be cut off
+    mid-word) are committed and dropped from the buffer. When recording
+    stops only the short uncommitted tail still needs transcribing.
+    """
+
+    def __init__(self, command: list, transcribe_segments, vad_mode: Optional[int] = None,
+                 silence_stop_frames: int = 0):
+        """
+        Args:
+            command: Capture command writing raw PCM to stdout
+            transcribe_segments: Function taking PCM bytes and returning
+                a list of (end_seconds, text) segments
+            vad_mode: webrtcvad aggressiveness for detecting the end of
+                speech, or None to disable
+            silence_stop_frames: Signal wake_fd after this many silent
+                30ms frames following speech (0 disables auto-stop)
+        """
+        self.command = command
+        self.transcribe_segments = transcribe_segments
+        # Own detector: webrtcvad keeps adaptive state, so it must only see this live stream
+        self.vad = webrtcvad.Vad(vad_mode) if vad_mode is not None else None
+        self.silence_stop_frames = silence_stop_frames
+        self.buffer = bytearray()
+        self.committed = []
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.proc = None
+        self.wake_fd = self._wake_w = None
+
+    def start(self):
+        """Start the capture process and background threads"""
+        # Own process group so stopping also reaches pipeline/wrapper children
+        self.proc = subprocess.Popen(
+            self.command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        # Becomes readable when speech is followed by enough silence; created
+        # only once capture is running so a failed start leaks nothing
+        self.wake_fd, self._wake_w = os.pipe()
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+        self.worker = threading.Thread(target=self._partial_loop, daemon=True)
+        self.reader.start()
+        self.worker.start()
+
+    def _read_loop(self):
+        """Append captured audio to the buffer until the capture process exits"""
+        fd = self.proc.stdout.fileno()
+        auto_stop = self.vad is not None and self.silence_stop_frames > 0
+        pending = bytearray()
+        heard_speech = False
+        silent_frames = 0
+
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            with self.lock:
+                self.buffer += chunk
+
+            if not auto_stop:
+                continue
+            pending += chunk
+            while len(pending) >= VAD_FRAME_BYTES:
+                frame = bytes(pending[:VAD_FRAME_BYTES])
+                del pending[:VAD_FRAME_BYTES]
+                if self.vad.is_speech(frame, SAMPLE_RATE):
+                    heard_speech = True
+                    silent_frames = 0
+                elif heard_speech:
+                    silent_frames += 1
+                    if silent_frames == self.silence_stop_frames:
+                        os.write(self._wake_w, b'\x00')
+
+    def _partial_loop(self):
+        """Periodically transcribe and commit stable segments"""
+        transcribed_len = 0
+        while not self.stopped.wait(0.1):
+            with self.lock:
+                pcm = bytes(self.buffer)
+            if len(pcm) - transcribed_len < PARTIAL_INTERVAL_SAMPLES * SAMPLE_WIDTH:
+                continue
+
+            try:
+                segments = self.transcribe_segments(pcm)
+            except Exception:
+                # The final pass covers anything not committed here
+                transcribed_len = len(pcm)
+                continue
+
+            cut = 0
+            if len(segments) > 1:
+                self.committed.extend(text for _, text in segments[:-1])
+                cut = int(segments[-2][0] * SAMPLE_RATE) * SAMPLE_WIDTH
+                with self.lock:
+                    del self.buffer[:cut]
+            transcribed_len = len(pcm) - cut
+
+    def stop_capture(self):
+        """Terminate the capture process and background threads (safe to call twice)"""
+        if self.stopped.is_set():
+            return
+
+        self._signal_capture(signal.SIGTERM)
+        try:
+            self.proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+        # Kill any survivors still holding the pipe open, so the reader sees EOF
+        self._signal_capture(signal.SIGKILL)
+        self.proc.wait()
+        self.reader.join(timeout=1)
+        if not self.reader.is_alive():
+            self.proc.stdout.close()
+
+        # Let an in-flight partial pass finish so its segments get committed
+        self.stopped.set()
+        self.worker.join()
+
+        os.close(self.wake_fd)
+        os.close(self._wake_w)
+
+    def _signal_capture(self, sig):
+        """Send sig to the whole capture process group"""
+        try:
+            os.killpg(self.proc.pid, sig)
+        except ProcessLookupError:
+            pass  # Everything already exited
+
+    def stop(self) -> str:
+        """Stop capturing, transcribe the remaining tail and return the full text"""
+        self.stop_capture()
+
+        with self.lock:
+            tail = bytes(self.buffer)
+        if len(tail) >= MIN_TAIL_SAMPLES * SAMPLE_WIDTH:
+            self.committed.extend(text for _, text in self.transcribe_segments(tail))
+
+        return " ".join(text.strip() for text in self.committed).strip()
 
 
 class VoiceInputHandler:
@@ -90,35 +321,75 @@ class VoiceInputHandler:
 
     def __init__(self, config: Config):
         self.config = config
-        self.openai_client = OpenAI(api_key=config.get('openai', 'api_key'))
+        self.backend = config.get('whisper', 'backend', fallback='openai')
+        self.openai_client = None
+        self.whisper_model = None  # Local faster-whisper model, loaded on first use
+        self._rec_proc = None  # Running termux-microphone-record, reaped after stopping
+
+        if self.backend == 'openai':
+            if OpenAI is None:
+                print("ERROR: openai package not installed. Run: pip install openai")
+                sys.exit(1)
+            self.openai_client = OpenAI(
+                api_key=config.get('openai', 'api_key'),
+                http_client=self._create_http_client()
+            )
+        # Optional PCM capture command enabling streaming transcription
+        self.stream_command = shlex.split(config.get('audio', 'stream_command', fallback=''))
+
+        # Voice activity detection for trimming silence from streamed audio
+        self.vad_mode = None
+        if self.stream_command and webrtcvad is not None:
+            self.vad_mode = config.getint('audio', 'vad_mode', fallback=2)
+        silence_stop_ms = config.getint('audio', 'silence_stop_ms', fallback=0)
+        self.silence_stop_frames = silence_stop_ms // 30
+
+    def _create_http_client(self):
+        """Long-lived HTTP client so transcriptions reuse the TLS connection"""
+        timeout = 30
+        limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=600)
+        try:
+            return httpx.Client(http2=True, timeout=timeout, limits=limits)
+        except ImportError:
+            # HTTP/2 needs the h2 package; keep-alive still works over HTTP/1.1
+            return httpx.Client(timeout=timeout, limits=limits)
 
     def cleanup_existing_recording(self):
         """Stop any existing recording sessions"""
         try:
-            subprocess.run(['termux-microphone-record', '-q'],
-                         capture_output=True, timeout=1)
+            subprocess.run([RECORDER_BIN, '-q'],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=1)
         except:
             pass
 
+        # Reap the recorder we started so it doesn't linger as a zombie
+        if self._rec_proc is not None:
+            try:
+                self._rec_proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._rec_proc.kill()
+                self._rec_proc.wait()
+            self._rec_proc = None
+
     def record_audio(self) -> Optional[Path]:
         """Record audio using termux-microphone-record (manual stop mode)"""
         # Ensure no recording is already in progress
         self.cleanup_existing_recording()
 
-        temp_file = Path(tempfile.mktemp(suffix='.m4a'))
-
-        # Remove existing file if it exists
-        if temp_file.exists():
-            temp_file.unlink()
+        # Fresh path in a private directory: no mktemp race, and the file
+        # doesn't exist yet (termux-microphone-record refuses existing files)
+        temp_file = Path(tempfile.mkdtemp()) / 'rec.m4a'
 
         try:
             # Manual stop mode - start recording in background
             sys.stderr.write("\r\n🎤 Recording... (press Enter to stop)\r\n")
             sys.stderr.flush()
 
-            # Start recording with no time limit (-l 0)
-            subprocess.Popen(
-                ['termux-microphone-record', '-f', str(temp_file), '-l', '0', '-e', 'aac'],
+            # Start recording with no time limit (-l 0), directly in Whisper's
+            # 16 kHz mono format so nothing needs resampling afterwards
+            self._rec_proc = subprocess.Popen(
+                [RECORDER_BIN, '-f', str(temp_file), '-l', '0', '-e', 'aac',
+                 '-r', str(SAMPLE_RATE), '-c', '1'],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
@@ -130,31 +401,55 @@ class VoiceInputHandler:
             sys.stderr.write(f"\r\n❌ Recording error: {e}\r\n")
             sys.stderr.flush()
             self.cleanup_existing_recording()
+            self._remove_recording(temp_file)
             return None
 
+    def _remove_recording(self, audio_file: Path):
+        """Delete a recording along with its private temp directory"""
+        shutil.rmtree(audio_file.parent, ignore_errors=True)
+
+    def _get_whisper_model(self):
+        """Load the local faster-whisper model once and reuse it"""
+        if self.whisper_model is None:
+            try:
+                from faster_whisper import WhisperModel
+            except ImportError:
+                raise RuntimeError("faster-whisper not installed. Run: pip install faster-whisper")
+
+            sys.stderr.write("⏳ Loading Whisper model...\r\n")
+            sys.stderr.flush()
+            self.whisper_model = WhisperModel(
+                self.config.get('whisper', 'model', fallback='small'),
+                device="cpu",
+                compute_type="int8",
+                cpu_threads=self.config.getint('whisper', 'threads', fallback=1)
+            )
+        return self.whisper_model
+
+    def _transcribe_local(self, audio) -> list:
+        """Transcribe a file path or float32 array locally, returning (end_seconds, text) segments"""
+        segments, _ = self._get_whisper_model().transcribe(audio, language="en", vad_filter=True)
+        return [(seg.end, seg.text) for seg in segments]
+
     def transcribe_audio(self, audio_file: Path) -> Optional[str]:
-        """Transcribe audio using OpenAI Whisper API"""
+        """Transcribe audio file using the configured Whisper backend"""
         sys.stderr.write("🔄 Transcribing...\r\n")
         sys.stderr.flush()
 
         try:
-            with open(audio_file, 'rb') as f:
-                response = self.openai_client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=f,
-                    language="en"
-                )
-
-            text = response.text.strip()
-
-            if text:
-                sys.stderr.write(f"✅ Transcribed: {text}\r\n")
-                sys.stderr.flush()
-                return text
+            if self.backend == 'faster-whisper':
+                segments = self._transcribe_local(str(audio_file))
+                text = "".join(text for _, text in segments)
             else:
-                sys.stderr.write("❌ Empty transcription\r\n")
-                sys.stderr.flush()
-                return None
+                with open(audio_file, 'rb') as f:
+                    response = self.openai_client.audio.transcriptions.create(
+                        model="whisper-1",
+                        file=f,
+                        language="en"
+                    )
+                text = response.text
+
+            return self._report_transcription(text.strip())
 
         except Exception as e:
             sys.stderr.write(f"❌ Transcription error: {e}\r\n")
@@ -162,8 +457,160 @@ class VoiceInputHandler:
             return None
         finally:
             # Clean up temp file
-            if audio_file.exists():
-                audio_file.unlink()
+            self._remove_recording(audio_file)
+
+    def _report_transcription(self, text: str) -> Optional[str]:
+        """Show transcription result, returning None for empty text"""
+        if text:
+            sys.stderr.write(f"✅ Transcribed: {text}\r\n")
+            sys.stderr.flush()
+            return text
+        else:
+            sys.stderr.write("❌ Empty transcription\r\n")
+            sys.stderr.flush()
+            return None
+
+    def _voiced_range(self, pcm: bytes) -> tuple:
+        """Return (start, end) byte offsets of the speech in pcm, or None if there is none"""
+        # Fresh detector per scan so state from earlier scans or the live
+        # auto-stop stream doesn't bleed into the trim boundaries
+        vad = webrtcvad.Vad(self.vad_mode)
+        frames = len(pcm) // VAD_FRAME_BYTES
+        voiced = [
+            i for i in range(frames)
+            if vad.is_speech(pcm[i * VAD_FRAME_BYTES:(i + 1) * VAD_FRAME_BYTES], SAMPLE_RATE)
+        ]
+        if not voiced:
+            return None
+
+        start = max(voiced[0] - VAD_PADDING_FRAMES, 0) * VAD_FRAME_BYTES
+        end = min(voiced[-1] + 1 + VAD_PADDING_FRAMES, frames) * VAD_FRAME_BYTES
+        if end == frames * VAD_FRAME_BYTES:
+            end = len(pcm)  # Keep the partial frame at the end
+        return start, end
+
+    def transcribe_pcm_segments(self, pcm: bytes) -> list:
+        """Transcribe raw PCM with the configured backend, returning (end_seconds, text) segments
+
+        With VAD enabled, leading and trailing silence is dropped before
+        transcribing; segment times stay relative to the start of pcm.
+        """
+        if self.vad_mode is not None:
+            voiced = self._voiced_range(pcm)
+            if voiced is None:
+                return []
+            start, end = voiced
+            offset = start / (SAMPLE_RATE * SAMPLE_WIDTH)
+            return [(t + offset, text) for t, text in self._transcribe_pcm(pcm[start:end])]
+        return self._transcribe_pcm(pcm)
+
+    def _transcribe_pcm(self, pcm: bytes) -> list:
+        """Transcribe raw PCM with the configured backend"""
+        if self.backend == 'faster-whisper':
+            import numpy as np
+            audio = np.frombuffer(pcm[:len(pcm) - len(pcm) % SAMPLE_WIDTH], np.int16).astype(np.float32) / 32768.0
+            return self._transcribe_local(audio)
+
+        response = self.openai_client.audio.transcriptions.create(
+            model="whisper-1",
+            file=encode_pcm_for_upload(pcm),
+            language="en",
+            response_format="verbose_json"
+        )
+        return [(seg.end, seg.text) for seg in (response.segments or [])]
+
+    def get_streaming_voice_input(self, stop_callback) -> Optional[str]:
+        """Record and transcribe voice input, transcribing while recording
+
+        Args:
+            stop_callback: Function to call to wait for stop signal
+        """
+        # Ensure termux-microphone-record isn't holding the microphone
+        self.cleanup_existing_recording()
+
+        transcriber = StreamingTranscriber(
+            self.stream_command,
+            self.transcribe_pcm_segments,
+            vad_mode=self.vad_mode,
+            silence_stop_frames=self.silence_stop_frames
+        )
+        try:
+            if self.vad_mode is not None and self.silence_stop_frames:
+                sys.stderr.write("\r\n🎤 Recording... (press Enter or pause to stop)\r\n")
+            else:
+                sys.stderr.write("\r\n🎤 Recording... (press Enter to stop)\r\n")
+            sys.stderr.flush()
+            transcriber.start()
+        except Exception as e:
+            sys.stderr.write(f"\r\n❌ Recording error: {e}\r\n")
+            sys.stderr.flush()
+            return None
+
+        # Wait for stop signal (Enter, or silence after speech); release the
+        # microphone even if waiting fails
+        try:
+            stop_callback(transcriber.wake_fd)
+        finally:
+            transcriber.stop_capture()
+
+        sys.stderr.write("✅ Recording stopped\r\n")
+        sys.stderr.write("🔄 Transcribing...\r\n")
+        sys.stderr.flush()
+
+        try:
+            return self._report_transcription(transcriber.stop())
+        except Exception as e:
+            sys.stderr.write(f"❌ Transcription error: {e}\r\n")
+            sys.stderr.flush()
+            return None
+
+    def _watch_recording(self, audio_file: Path):
+        """Start an inotify watch for the recorder closing audio_file (if pyinotify is available)"""
+        if pyinotify is None:
+            return None
+
+        try:
+            closed = set()
+            wm = pyinotify.WatchManager()
+            wm.add_watch(str(audio_file.parent), pyinotify.IN_CLOSE_WRITE,
+                         proc_fun=lambda event: closed.add(event.pathname))
+            notifier = pyinotify.Notifier(wm)
+            notifier.closed = closed
+            return notifier
+        except Exception:
+            return None
+
+    def _wait_for_recording(self, audio_file: Path, notifier=None):
+        """Wait until the recorder has finished writing audio_file
+
+        Uses the inotify close-write event when available, otherwise polls
+        until the file size is stable. Gives up after RECORDING_SETTLE_TIMEOUT.
+        """
+        deadline = time.monotonic() + RECORDING_SETTLE_TIMEOUT
+
+        if notifier is not None:
+            try:
+                while str(audio_file) not in notifier.closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    if notifier.check_events(timeout=int(remaining * 1000)):
+                        notifier.read_events()
+                        notifier.process_events()
+            finally:
+                notifier.stop()
+            return
+
+        last_size = -1
+        while time.monotonic() < deadline:
+            try:
+                size = audio_file.stat().st_size
+            except FileNotFoundError:
+                size = -1
+            if size == last_size and size >= MIN_RECORDING_BYTES:
+                return
+            last_size = size
+            time.sleep(0.02)
 
     def get_voice_input(self, stop_callback) -> Optional[str]:
         """Record and transcribe voice input (manual stop mode)
@@ -171,27 +618,39 @@ class VoiceInputHandler:
         Args:
             stop_callback: Function to call to wait for stop signal
         """
+        if self.stream_command:
+            return self.get_streaming_voice_input(stop_callback)
+
         audio_file = self.record_audio()
         if not audio_file:
             return None
 
-        # Wait for stop signal
-        stop_callback()  # Wait for user to press Ctrl+Space again
+        # Watch for the recorder closing the file before asking it to stop
+        notifier = self._watch_recording(audio_file)
+
+        # Wait for stop signal; on failure stop the recorder and clean up
+        try:
+            stop_callback()  # Wait for user to press Ctrl+Space again
+        except BaseException:
+            self.cleanup_existing_recording()
+            if notifier is not None:
+                notifier.stop()
+            self._remove_recording(audio_file)
+            raise
 
         # Stop recording
         self.cleanup_existing_recording()
         sys.stderr.write("✅ Recording stopped\r\n")
         sys.stderr.flush()
 
-        # Wait a bit for file to be written
-        time.sleep(0.5)
+        # Wait for file to be written
+        self._wait_for_recording(audio_file, notifier)
 
         # Check if file exists and has content
-        if not audio_file.exists() or audio_file.stat().st_size < 1000:
+        if not audio_file.exists() or audio_file.stat().st_size < MIN_RECORDING_BYTES:
             sys.stderr.write("❌ Recording failed or too short\r\n")
             sys.stderr.flush()
-            if audio_file.exists():
-                audio_file.unlink()
+            self._remove_recording(audio_file)
             return None
 
         return self.transcribe_audio(audio_file)
@@ -200,12 +659,20 @@ class VoiceInputHandler:
 class ClaudeVoiceTUI:
     """Main application: SSH to Claude with voice input support"""
 
-    def __init__(self, config_path: str = "voice_config.ini", working_dir: Optional[str] = None, continue_session: bool = False):
+    def __init__(self, config_path: str = "voice_config.toml", working_dir: Optional[str] = None, continue_session: bool = False):
         self.config = Config(config_path)
         self.voice_handler = VoiceInputHandler(self.config)
         self.working_dir = working_dir  # Override for dev_path from CLI
         self.continue_session = continue_session  # Whether to continue previous Claude session
         self.master_fd = None  # PTY master file descriptor for terminal size updates
+        self._splice_pipe = None  # Pipe used to splice PTY output to stdout in-kernel
+
+        # Directory for SSH ControlMaster sockets (shared by all connections to the dev machine)
+        Path("~/.ssh/controlmasters").expanduser().mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        # MCP config and Termux IP don't change while running; computed on first use
+        self._mcp_json = None
+        self._termux_ip = None
 
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -236,14 +703,133 @@ class ClaudeVoiceTUI:
         except:
             pass
 
-    def master_read(self, fd):
-        """Capture PTY master fd and read child output"""
-        if self.master_fd is None:
-            self.master_fd = fd
-            # Set initial terminal size
-            rows, cols = self._get_terminal_size()
-            self._set_terminal_size(self.master_fd, rows, cols)
-        return os.read(fd, 1024)
+    def _write_stdout(self, data: bytes):
+        """Write all of data to stdout"""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(pty.STDOUT_FILENO, view):]
+
+    def _relay_output(self, master_fd) -> bool:
+        """Copy available child output to stdout, returning False at EOF
+
+        Uses os.splice through a pipe so output never enters userspace. Falls
+        back to read/write for good if the kernel can't splice this TTY.
+        """
+        if self._splice_pipe is not None:
+            pipe_r, pipe_w = self._splice_pipe
+            try:
+                n = os.splice(master_fd, pipe_w, PTY_CHUNK,
+                              flags=os.SPLICE_F_MOVE | os.SPLICE_F_MORE | os.SPLICE_F_NONBLOCK)
+            except BlockingIOError:
+                return True
+            except OSError as e:
+                if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                    return False  # EIO once the child has exited
+                self._close_splice_pipe()
+                return self._relay_output(master_fd)
+
+            if n == 0:
+                return False
+            try:
+                while n > 0:
+                    n -= os.splice(pipe_r, pty.STDOUT_FILENO, n, flags=os.SPLICE_F_MOVE)
+            except OSError as e:
+                if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                    raise
+                # stdout can't be spliced into: flush what's in the pipe and stop splicing
+                self._write_stdout(os.read(pipe_r, n))
+                self._close_splice_pipe()
+            return True
+
+        try:
+            data = os.read(master_fd, PTY_CHUNK)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        if not data:
+            return False
+        self._write_stdout(data)
+        return True
+
+    def _close_splice_pipe(self):
+        """Close the splice pipe, switching output relaying to read/write"""
+        if self._splice_pipe is not None:
+            for fd in self._splice_pipe:
+                os.close(fd)
+            self._splice_pipe = None
+
+    def _copy(self, master_fd):
+        """Relay child output to stdout and stdin (through stdin_read) to the child"""
+        stdin_fd = pty.STDIN_FILENO
+        to_child = b''
+
+        sel = selectors.DefaultSelector()  # epoll on Linux
+        try:
+            sel.register(stdin_fd, selectors.EVENT_READ)
+        except PermissionError:
+            # epoll rejects regular files and /dev/null on stdin; poll accepts them
+            sel.close()
+            sel = selectors.PollSelector()
+            sel.register(stdin_fd, selectors.EVENT_READ)
+        sel.register(master_fd, selectors.EVENT_READ)
+        try:
+            while True:
+                for key, events in sel.select():
+                    if key.fd == master_fd:
+                        if events & selectors.EVENT_READ and not self._relay_output(master_fd):
+                            return
+                        if events & selectors.EVENT_WRITE:
+                            to_child = to_child[os.write(master_fd, to_child):]
+                            if not to_child:
+                                sel.modify(master_fd, selectors.EVENT_READ)
+                    elif key.fd == stdin_fd:
+                        data = self.stdin_read(stdin_fd)
+                        if not data:
+                            sel.unregister(stdin_fd)
+                            continue
+                        if not to_child:
+                            sel.modify(master_fd, selectors.EVENT_READ | selectors.EVENT_WRITE)
+                        to_child += data
+        finally:
+            sel.close()
+
+    def _spawn(self, argv) -> int:
+        """Run argv on a new PTY and relay terminal I/O until it exits
+
+        Equivalent to pty.spawn(), but moves output with os.splice where
+        supported and waits on an epoll selector (poll if stdin isn't pollable by epoll).
+        """
+        pid, master_fd = pty.fork()
+        if pid == pty.CHILD:
+            os.execlp(argv[0], *argv)
+
+        self.master_fd = master_fd
+        rows, cols = self._get_terminal_size()
+        self._set_terminal_size(master_fd, rows, cols)
+        os.set_blocking(master_fd, False)
+        if hasattr(os, 'splice'):
+            self._splice_pipe = os.pipe()
+
+        try:
+            mode = termios.tcgetattr(pty.STDIN_FILENO)
+            tty.setraw(pty.STDIN_FILENO)
+            restore = True
+        except termios.error:
+            restore = False
+
+        try:
+            self._copy(master_fd)
+        finally:
+            if restore:
+                termios.tcsetattr(pty.STDIN_FILENO, termios.TCSAFLUSH, mode)
+            self._close_splice_pipe()
+            self.master_fd = None
+            os.close(master_fd)
+            # Always reap the child, even if relaying failed
+            status = os.waitpid(pid, 0)[1]
+
+        return status
 
     def _handle_sigwinch(self, signum, frame):
         """Handle terminal size changes"""
@@ -259,6 +845,7 @@ class ClaudeVoiceTUI:
 
         # MCP config for Claude to SSH to Termux and run the MCP server
         # Termux sshd runs on port 8022 by default
+        # ControlMaster lets repeated MCP launches reuse one multiplexed SSH connection
         return {
             "mcpServers": {
                 "termux-tts": {
@@ -266,6 +853,9 @@ class ClaudeVoiceTUI:
                     "args": [
                         "-p", "8022",
                         "-o", "StrictHostKeyChecking=no",
+                        "-o", "ControlMaster=auto",
+                        "-o", "ControlPath=~/.ssh/cm-%r@%h:%p",
+                        "-o", "ControlPersist=2h",
                         f"{termux_user}@{termux_ip}",
                         f"cd {script_dir} && python3 tts_mcp_server.py"
                     ],
@@ -275,13 +865,22 @@ class ClaudeVoiceTUI:
         }
 
     def get_termux_ip_from_ssh(self) -> str:
-        """Get Termux's IP as seen from the dev machine"""
+        """Get Termux's IP as seen from the dev machine (looked up once)"""
+        if self._termux_ip is not None:
+            return self._termux_ip
+
+        # Explicit override, e.g. when the dev machine reaches Termux through NAT
+        env_ip = os.environ.get('TERMUX_LAN_IP')
+        if env_ip:
+            self._termux_ip = env_ip
+            return env_ip
+
         # Get local IP that would be used to connect to dev machine
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect((self.config.get('ssh', 'host'), 1))
-        ip = s.getsockname()[0]
+        self._termux_ip = s.getsockname()[0]
         s.close()
-        return ip
+        return self._termux_ip
 
     def build_ssh_command(self):
         """Build SSH command for Claude with tmux session management"""
@@ -292,15 +891,15 @@ class ClaudeVoiceTUI:
         dev_path = self.working_dir if self.working_dir else self.config.get('ssh', 'dev_path', fallback='~')
         claude_path = os.path.expanduser(self.config.get('claude', 'path'))
 
-        # Build MCP config
-        mcp_config = self.get_mcp_config()
-        mcp_json = json.dumps(mcp_config)
+        # Encode the MCP config once; errors surface inside run()'s handler
+        if self._mcp_json is None:
+            self._mcp_json = json.dumps(self.get_mcp_config())
 
         # Build Claude command with optional --continue flag
         system_prompt = "IMPORTANT: After providing your response to the user, use the mcp__termux-tts__speak tool to speak a concise vocal summary (1-2 sentences) of your reply. This helps the user understand your response through voice feedback."
 
         # Build Claude arguments with proper shell quoting
-        claude_args = f"--mcp-config {shlex.quote(mcp_json)} --append-system-prompt {shlex.quote(system_prompt)}"
+        claude_args = f"--mcp-config {shlex.quote(self._mcp_json)} --append-system-prompt {shlex.quote(system_prompt)}"
         if self.continue_session:
             claude_args += " --continue"
 
@@ -313,9 +912,13 @@ class ClaudeVoiceTUI:
         tmux_cmd = f"tmux attach-session -t {tmux_session} || tmux new-session -s {tmux_session} {shlex.quote(claude_cmd)}"
 
         # SSH command to run Claude in tmux
+        # Multiplex over a persistent master connection so reconnects skip the handshake
         return [
             'ssh',
             '-i', ssh_key,
+            '-o', 'ControlMaster=auto',
+            '-o', 'ControlPath=~/.ssh/controlmasters/%r@%h:%p',
+            '-o', 'ControlPersist=2h',
             '-t',  # Force TTY allocation
             f'{ssh_user}@{ssh_host}',
             tmux_cmd
@@ -327,18 +930,19 @@ class ClaudeVoiceTUI:
         data = os.read(fd, 1024)
 
         # Check for Ctrl+Space (0x00)
-        if b'\x00' in data:
-            # Handle voice input synchronously and get the result
-            voice_text = self._handle_voice_input_sync(fd)
+        idx = data.find(b'\x00')
+        if idx < 0:
+            return data
 
-            # Remove Ctrl+Space from data
-            data = data.replace(b'\x00', b'')
+        # Handle voice input synchronously and get the result
+        voice_text = self._handle_voice_input_sync(fd)
 
-            # If we got voice text, return it
-            if voice_text:
-                return voice_text
+        # If we got voice text, return it
+        if voice_text:
+            return voice_text
 
-        return data
+        # Remove Ctrl+Space from data
+        return data[:idx] + data[idx + 1:]
 
     def _handle_voice_input_sync(self, stdin_fd):
         """Handle voice input synchronously and return the transcribed text"""
@@ -350,15 +954,21 @@ class ClaudeVoiceTUI:
             tty.setcbreak(stdin_fd)
 
             # Define callback for waiting on stop signal in manual mode
-            def wait_for_stop():
+            def wait_for_stop(wake_fd=None):
                 # Use \r\n for proper output in raw terminal
                 sys.stderr.write("\r\nPress Enter to stop recording...\r\n")
                 sys.stderr.flush()
 
-                # Wait for Enter key
+                # Sleep in the kernel until input arrives, then drain it in one read
+                poller = select.poll()
+                poller.register(stdin_fd, select.POLLIN)
+                if wake_fd is not None:
+                    poller.register(wake_fd, select.POLLIN)  # Auto-stop on silence
                 while True:
-                    char = os.read(stdin_fd, 1)
-                    if char == b'\r':  # Enter key
+                    ready = dict(poller.poll())
+                    if wake_fd in ready:
+                        break
+                    if stdin_fd in ready and b'\r' in os.read(stdin_fd, 64):  # Enter key
                         break
 
             # Get voice input
@@ -398,9 +1008,8 @@ class ClaudeVoiceTUI:
             print(f"Working directory: {dev_path}", file=sys.stderr)
             print("Press Ctrl+Space to record, Enter to stop, Enter again to send, Ctrl+C to exit\n", file=sys.stderr)
 
-            # Use pty.spawn() for proper terminal handling
-            # This automatically handles all PTY setup and cleanup
-            pty.spawn(ssh_cmd, master_read=self.master_read, stdin_read=self.stdin_read)
+            # Run SSH on a PTY; handles all terminal setup and cleanup
+            self._spawn(ssh_cmd)
 
         except KeyboardInterrupt:
             print("\n\nInterrupted by user", file=sys.stderr)
@@ -427,7 +1036,7 @@ Usage:
 Examples:
   %(prog)s ~/projects/myapp          # Start in ~/projects/myapp
   %(prog)s                           # Use directory from config
-  %(prog)s --config my.ini ~/code    # Custom config + directory
+  %(prog)s --config my.toml ~/code   # Custom config + directory
         '''
     )
     parser.add_argument(
@@ -437,8 +1046,8 @@ Examples:
     )
     parser.add_argument(
         '--config',
-        default='voice_config.ini',
-        help='Path to config file (default: voice_config.ini)'
+        default='voice_config.toml',
+        help='Path to config file (default: voice_config.toml)'
     )
     parser.add_argument(
         '--continue',
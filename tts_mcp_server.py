@@ -9,25 +9,77 @@ Usage:
     python tts_mcp_server.py
 """
 
-import subprocess
-from configparser import ConfigParser
+import asyncio
+import re
+import shutil
+import tomllib
 from pathlib import Path
 from mcp.server.fastmcp import FastMCP
 
-# Load TTS configuration
-config_path = Path(__file__).parent / "voice_config.ini"
-config = ConfigParser()
-config.read(config_path)
+# TTS configuration, reread only when the file changes
+config_path = Path(__file__).parent / "voice_config.toml"
+_CONFIG_CACHE: dict[tuple, tuple] = {}
+
+
+def get_tts_settings() -> tuple:
+    """Return (pitch, rate) from the config, cached on (mtime, size)"""
+    try:
+        st = config_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    if key not in _CONFIG_CACHE:
+        try:
+            with open(config_path, 'rb') as f:
+                tts = tomllib.load(f).get('tts', {})
+        except (OSError, tomllib.TOMLDecodeError):
+            tts = {}
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = (
+            float(tts.get('pitch', 1.0)),
+            float(tts.get('rate', 2.0))
+        )
+    return _CONFIG_CACHE[key]
 
-TTS_PITCH = config.getfloat('tts', 'pitch', fallback=1.0)
-TTS_RATE = config.getfloat('tts', 'rate', fallback=2.0)
 
 # Create MCP server
 mcp = FastMCP("termux-tts")
 
+# Sentences waiting to be spoken, in order, and the task speaking them
+_speech_queue: asyncio.Queue = asyncio.Queue()
+_speech_worker = None
+
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+TTS_TIMEOUT = 30  # Seconds; termux-api calls can hang forever without the Termux:API app
+
+
+async def _speak_queued():
+    """Speak queued sentences one at a time"""
+    while True:
+        sentence = await _speech_queue.get()
+        pitch, rate = get_tts_settings()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'termux-tts-speak',
+                '-p', str(pitch),
+                '-r', str(rate),
+                sentence,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                await asyncio.wait_for(proc.wait(), TTS_TIMEOUT)
+            except asyncio.TimeoutError:
+                # Don't let a stuck process block the rest of the queue
+                proc.kill()
+                await proc.wait()
+        except Exception:
+            pass  # Nobody left to report to; carry on with the next sentence
+
 
 @mcp.tool()
-def speak(text: str) -> str:
+async def speak(text: str) -> str:
     """
     Speak text aloud using Android text-to-speech.
 
@@ -40,25 +92,23 @@ def speak(text: str) -> str:
         text: The text to speak aloud (keep it concise for voice)
 
     Returns:
-        Status message indicating success or error
+        Status message indicating speech started or error
     """
-    cmd = [
-        'termux-tts-speak',
-        '-p', str(TTS_PITCH),
-        '-r', str(TTS_RATE),
-        text
-    ]
+    global _speech_worker
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return f"Successfully spoke: {text[:50]}{'...' if len(text) > 50 else ''}"
-        else:
-            return f"TTS error: {result.stderr}"
-    except subprocess.TimeoutExpired:
-        return "TTS error: timeout (speech took too long)"
-    except Exception as e:
-        return f"TTS error: {str(e)}"
+    if shutil.which('termux-tts-speak') is None:
+        return "TTS error: termux-tts-speak not found (pkg install termux-api)"
+
+    # Speak sentence by sentence so the first one starts without waiting
+    # for the whole text to be synthesized
+    for sentence in SENTENCE_END.split(text.strip()):
+        if sentence:
+            _speech_queue.put_nowait(sentence)
+
+    if _speech_worker is None or _speech_worker.done():
+        _speech_worker = asyncio.create_task(_speak_queued())
+
+    return f"Speaking: {text[:50]}{'...' if len(text) > 50 else ''}"
 
 
 if __name__ == "__main__":